@@ -1,11 +1,20 @@
 import discord
 from discord.ui import View, Button
 import os
+import hashlib
 import logging
 import asyncio
+import time
 import re
 import difflib
+import functools
 from datetime import datetime, timedelta
+
+try:
+    from rapidfuzz import process, fuzz
+except ImportError:  # Fall back to stdlib difflib if rapidfuzz is missing
+    process = None
+    fuzz = None
 from zoneinfo import ZoneInfo
 import sqlite3
 import json
@@ -31,6 +40,39 @@ except ValueError:
 DB_NAME = "announcements.db"
 CAIRO_TZ = ZoneInfo("Africa/Cairo")
 
+_FOOTER_TEXT = "D7M Announcement"
+
+
+def _hash_and_write(filename: str, data: bytes) -> str:
+    """Writes attachment bytes under their content hash; blocking, so run
+    off the event loop."""
+    ext = os.path.splitext(filename)[1]
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    path = os.path.join("attachments", f"{digest}{ext}")
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(data)
+    return path
+
+
+def _unlink_all(paths: List[str]):
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _format_run_at(run_at_ts: Optional[int]) -> str:
+    """Renders a stored epoch timestamp as Cairo local time."""
+    if run_at_ts is None:
+        return "?"
+    return datetime.fromtimestamp(run_at_ts, CAIRO_TZ).strftime("%Y-%m-%d %H:%M:%S")
+
+# Prefix match (no end anchor) so "10min"/"2hours"/"1day" still parse.
+_TIME_RE = re.compile(r"(\d+)([mhd])", re.ASCII)
+_UNIT_MULT = {"m": 60, "h": 3600, "d": 86400}
+
 COLOR_MAP = {
     "red": 0xFF0000,
     "blue": 0x3498DB,
@@ -46,118 +88,207 @@ COLOR_MAP = {
     "default": 0x2B2D31,
 }
 
+_DEFAULT_COLOR = 0x2B2D31
+
+# Immutable defaults for _parse_content; mutable fields are added per call.
+_BASE_CONFIG = {
+    "color": _DEFAULT_COLOR,
+    "everyone": False,
+    "preview": False,
+    "poll": False,
+    "channel": None,
+    "schedule": None,
+}
+
 
 class DBHandler:
-    """Context manager for SQLite database operations."""
+    """Context manager for SQLite operations on a shared connection."""
 
-    def __init__(self, db_name: str):
-        self.db_name = db_name
-        self.conn: Optional[sqlite3.Connection] = None
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
         self.cursor: Optional[sqlite3.Cursor] = None
 
     def __enter__(self):
-        self.conn = sqlite3.connect(self.db_name)
         self.cursor = self.conn.cursor()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.conn:
-            if exc_type is None:
-                self.conn.commit()
-            self.conn.close()
+        if exc_type is None:
+            self.conn.commit()
+        else:
+            self.conn.rollback()
+        self.cursor.close()
+
+
+def connect_db(db_name: str = DB_NAME) -> sqlite3.Connection:
+    """Opens the bot's single long-lived SQLite connection."""
+    conn = sqlite3.connect(db_name, check_same_thread=False)
+    for pragma in (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",
+    ):
+        conn.execute(pragma)
+    return conn
 
 
-def init_db():
-    with DBHandler(DB_NAME) as db:
+def init_db(conn: sqlite3.Connection):
+    with DBHandler(conn) as db:
         db.cursor.execute("""CREATE TABLE IF NOT EXISTS scheduled (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         content TEXT,
                         run_at TIMESTAMP,
+                        run_at_ts INTEGER,
                         channel_name TEXT,
                         author_id INTEGER,
                         attachment_paths TEXT
                     )""")
+        # Migration: older databases stored only the Cairo-local run_at
+        # string; add the epoch column and backfill it.
+        columns = [r[1] for r in db.cursor.execute("PRAGMA table_info(scheduled)")]
+        if "run_at_ts" not in columns:
+            db.cursor.execute("ALTER TABLE scheduled ADD COLUMN run_at_ts INTEGER")
+            rows = db.cursor.execute(
+                "SELECT id, run_at FROM scheduled WHERE run_at IS NOT NULL"
+            ).fetchall()
+            backfill = []
+            for row_id, run_at in rows:
+                try:
+                    dt = datetime.strptime(run_at, "%Y-%m-%d %H:%M:%S").replace(
+                        tzinfo=CAIRO_TZ
+                    )
+                except (TypeError, ValueError):
+                    continue
+                backfill.append((int(dt.timestamp()), row_id))
+            db.cursor.executemany(
+                "UPDATE scheduled SET run_at_ts = ? WHERE id = ?", backfill
+            )
+        db.cursor.execute("DROP INDEX IF EXISTS idx_scheduled_run_at")
+        db.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_scheduled_run_at_ts ON scheduled(run_at_ts)"
+        )
+        db.cursor.execute("""CREATE TABLE IF NOT EXISTS attachment_refs (
+                        path TEXT PRIMARY KEY,
+                        refs INTEGER NOT NULL DEFAULT 0
+                    )""")
 
 
 class LinkButtonView(View):
+    __slots__ = ()
+
     def __init__(self, buttons_config: List[Tuple[str, str]]):
-        super().__init__()
+        # Link buttons have no callbacks, so there is nothing to time out;
+        # timeout=None avoids the default 180s timer keeping the view alive.
+        super().__init__(timeout=None)
         for label, url in buttons_config:
             self.add_item(Button(label=label, url=url))
 
 
+@functools.lru_cache(maxsize=1)
+def _usage_guide_embed() -> discord.Embed:
+    """The static help embed, built once on first use."""
+    embed = discord.Embed(title="📢 D7M Announcer Utils", color=0x3498DB)
+    embed.description = "I am ready! Send me a DM to make an announcement."
+    embed.add_field(
+        name="🔑 Configuration Keys",
+        value=(
+            "`channel: name` - Fuzzy search for target channel\n"
+            "`color: red/hex` - Set embed color\n"
+            "`mention: role` - Ping roles by name (comma separated)\n"
+            "`everyone: true` - Ping @everyone\n"
+            "`preview: true` - See it before sending (shows target)\n"
+            "`poll: true` - Add vote reactions\n"
+            "`schedule: 10m` - Delayed posting (10m, 1h, or YYYY-MM-DD HH:MM:SS)\n"
+            "`list` - Show scheduled messages\n"
+            "`edit: ID` - Edit a scheduled message\n"
+            "`cancel: ID` - Cancel a scheduled message\n"
+            "`button: Label | URL` - Add link buttons\n"
+            "`template` - Get a copy-paste template\n"
+            "`help` - Show this guide"
+        ),
+        inline=False,
+    )
+    embed.add_field(
+        name="📝 Example",
+        value=(
+            "channel: general\n"
+            "color: blue\n"
+            "mention: Gamers, Updates\n"
+            "button: Website | https://google.com\n"
+            "poll: true\n"
+            "Big news coming soon!"
+        ),
+        inline=False,
+    )
+    return embed
+
+
+@functools.lru_cache(maxsize=64)
+def _build_view(buttons_tuple: Tuple[Tuple[str, str], ...]) -> LinkButtonView:
+    """Memoized view factory; link-only views hold no per-message state,
+    so identical button sets (e.g. scheduled campaigns) can share one."""
+    return LinkButtonView(list(buttons_tuple))
+
+
 class EmbedBot(discord.Client):
     def __init__(self):
         intents = discord.Intents.default()
         intents.message_content = True
         intents.messages = True
         intents.guilds = True
-        intents.members = True  # Helpful for finding channels/users
-        super().__init__(intents=intents)
-        init_db()
+        # Channel/role lookups only need guild data; skipping the members
+        # intent avoids streaming and caching every member at startup.
+        super().__init__(
+            intents=intents,
+            member_cache_flags=discord.MemberCacheFlags.none(),
+            chunk_guilds_at_startup=False,
+        )
+        # Lazily-built lookup caches, kept fresh via gateway events instead of
+        # being rebuilt on every message.
+        self._channel_index: Dict[int, Dict[str, discord.TextChannel]] = {}
+        self._all_channels_index: Optional[Dict[str, discord.TextChannel]] = None
+        self._role_index: Dict[int, Dict[str, discord.Role]] = {}
+        # Memoized fuzzy results: (guild id, query) -> role id (or None).
+        self._role_fuzzy_cache: Dict[Tuple[int, str], Optional[int]] = {}
+        self._owner: Optional[discord.User] = None
+        self.db = connect_db()
+        init_db(self.db)
+        # Set whenever the schedule table changes, to wake the scheduler loop.
+        self._schedule_changed = asyncio.Event()
 
     async def setup_hook(self):
         self.bg_task = self.loop.create_task(self._check_schedule_loop())
 
+    async def close(self):
+        try:
+            self.db.execute("PRAGMA optimize")
+            self.db.close()
+        except sqlite3.Error:
+            pass
+        await super().close()
+
     async def on_ready(self):
         logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
+        self._ensure_channel_index()
         user = await self.fetch_user(OWNER_ID)
         if user:
+            self._owner = user
             await self._send_usage_guide(user)
 
     async def _send_usage_guide(self, user: discord.User):
-        embed = discord.Embed(title="📢 D7M Announcer Utils", color=0x3498DB)
-        embed.description = "I am ready! Send me a DM to make an announcement."
-        embed.add_field(
-            name="🔑 Configuration Keys",
-            value=(
-                "`channel: name` - Fuzzy search for target channel\n"
-                "`color: red/hex` - Set embed color\n"
-                "`mention: role` - Ping roles by name (comma separated)\n"
-                "`everyone: true` - Ping @everyone\n"
-                "`preview: true` - See it before sending (shows target)\n"
-                "`poll: true` - Add vote reactions\n"
-                "`schedule: 10m` - Delayed posting (10m, 1h, or YYYY-MM-DD HH:MM:SS)\n"
-                "`list` - Show scheduled messages\n"
-                "`edit: ID` - Edit a scheduled message\n"
-                "`cancel: ID` - Cancel a scheduled message\n"
-                "`button: Label | URL` - Add link buttons\n"
-                "`template` - Get a copy-paste template\n"
-                "`help` - Show this guide"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="📝 Example",
-            value=(
-                "channel: general\n"
-                "color: blue\n"
-                "mention: Gamers, Updates\n"
-                "button: Website | https://google.com\n"
-                "poll: true\n"
-                "Big news coming soon!"
-            ),
-            inline=False,
-        )
         try:
-            await user.send(embed=embed)
+            await user.send(embed=_usage_guide_embed())
         except Exception:
             logger.warning("Could not send DM to owner. Make sure DMs are open.")
 
     def _parse_time_offset(self, time_str: str) -> int:
         """Parses 10m, 1h, 1d into seconds."""
-        match = re.match(r"(\d+)([mhd])", time_str.lower())
+        match = _TIME_RE.match(time_str.lower())
         if not match:
             return 0
-        value = int(match.group(1))
-        unit = match.group(2)
-        if unit == "m":
-            return value * 60
-        if unit == "h":
-            return value * 3600
-        if unit == "d":
-            return value * 86400
-        return 0
+        return int(match.group(1)) * _UNIT_MULT[match.group(2)]
 
     def _parse_schedule_time(self, time_str: str) -> Optional[datetime]:
         """
@@ -195,21 +326,235 @@ class EmbedBot(discord.Client):
 
         return None
 
+    @staticmethod
+    def _iter_text_channels(guild: discord.Guild):
+        # guild.text_channels re-sorts by position on every access; the index
+        # doesn't care about ordering, so walk the raw channel cache instead.
+        return (
+            c for c in guild._channels.values() if isinstance(c, discord.TextChannel)
+        )
+
+    def _ensure_channel_index(self) -> Dict[str, discord.TextChannel]:
+        """Builds the channel lookup caches on first use."""
+        if self._all_channels_index is None:
+            self._channel_index = {
+                guild.id: {c.name.lower(): c for c in self._iter_text_channels(guild)}
+                for guild in self.guilds
+            }
+            self._rebuild_all_channels_index()
+        return self._all_channels_index
+
+    def _rebuild_all_channels_index(self):
+        merged: Dict[str, discord.TextChannel] = {}
+        for per_guild in self._channel_index.values():
+            merged.update(per_guild)
+        self._all_channels_index = merged
+
+    def _get_role_map(self, guild: discord.Guild) -> Dict[str, discord.Role]:
+        role_map = self._role_index.get(guild.id)
+        if role_map is None:
+            role_map = {r.name.lower(): r for r in guild.roles}
+            self._role_index[guild.id] = role_map
+        return role_map
+
+    def _resolve_role(
+        self, guild: discord.Guild, role_name: str
+    ) -> Optional[discord.Role]:
+        """Resolves a role by name: exact, then prefix, then fuzzy match."""
+        role_map = self._get_role_map(guild)
+        query = role_name.lower()
+
+        found = role_map.get(query)
+        if found is not None:
+            return found
+
+        # Prefix match is cheap and catches partial names like
+        # "mention: mod" for "Moderators" without the fuzzy scorer.
+        found = next(
+            (r for name, r in role_map.items() if name.startswith(query)), None
+        )
+        if found is not None:
+            return found
+
+        cache_key = (guild.id, query)
+        if cache_key in self._role_fuzzy_cache:
+            role_id = self._role_fuzzy_cache[cache_key]
+            return guild.get_role(role_id) if role_id is not None else None
+
+        if process is not None:
+            best = process.extractOne(
+                query, list(role_map.keys()), scorer=fuzz.ratio, score_cutoff=50
+            )
+            found = role_map[best[0]] if best else None
+        else:
+            matches = difflib.get_close_matches(query, role_map.keys(), n=1, cutoff=0.5)
+            found = role_map[matches[0]] if matches else None
+
+        self._role_fuzzy_cache[cache_key] = found.id if found else None
+        return found
+
+    async def on_guild_channel_create(self, channel):
+        if isinstance(channel, discord.TextChannel) and self._all_channels_index is not None:
+            name = channel.name.lower()
+            self._channel_index.setdefault(channel.guild.id, {})[name] = channel
+            self._all_channels_index[name] = channel
+
+    async def on_guild_channel_delete(self, channel):
+        if isinstance(channel, discord.TextChannel) and self._all_channels_index is not None:
+            self._channel_index.get(channel.guild.id, {}).pop(channel.name.lower(), None)
+            self._rebuild_all_channels_index()
+
+    async def on_guild_channel_update(self, before, after):
+        if isinstance(after, discord.TextChannel) and self._all_channels_index is not None:
+            per_guild = self._channel_index.setdefault(after.guild.id, {})
+            per_guild.pop(before.name.lower(), None)
+            per_guild[after.name.lower()] = after
+            self._rebuild_all_channels_index()
+
+    async def on_guild_join(self, guild: discord.Guild):
+        if self._all_channels_index is not None:
+            per_guild = {c.name.lower(): c for c in self._iter_text_channels(guild)}
+            self._channel_index[guild.id] = per_guild
+            self._all_channels_index.update(per_guild)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._channel_index.pop(guild.id, None)
+        self._invalidate_roles(guild.id)
+        if self._all_channels_index is not None:
+            self._rebuild_all_channels_index()
+
+    def _invalidate_roles(self, guild_id: int):
+        self._role_index.pop(guild_id, None)
+        for key in [k for k in self._role_fuzzy_cache if k[0] == guild_id]:
+            del self._role_fuzzy_cache[key]
+
+    async def on_guild_role_create(self, role: discord.Role):
+        self._invalidate_roles(role.guild.id)
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        self._invalidate_roles(role.guild.id)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self._invalidate_roles(after.guild.id)
+
     def _find_channel(self, channel_name: str) -> Optional[discord.TextChannel]:
         """Fuzzy search for a channel across all guilds."""
-        all_channels = []
-        for guild in self.guilds:
-            for channel in guild.text_channels:
-                all_channels.append(channel)
-
-        channel_map = {c.name.lower(): c for c in all_channels}
-        matches = difflib.get_close_matches(
-            channel_name.lower(), channel_map.keys(), n=1, cutoff=0.4
-        )
+        channel_map = self._ensure_channel_index()
+        query = channel_name.lower()
+
+        # Exact name match is the common case (users copy the channel name);
+        # skip the fuzzy pass entirely when it hits.
+        exact = channel_map.get(query)
+        if exact is not None:
+            return exact
+
+        if process is not None:
+            best = process.extractOne(
+                query, list(channel_map.keys()), scorer=fuzz.WRatio, score_cutoff=40
+            )
+            if best:
+                return channel_map[best[0]]
+            return None
+
+        matches = difflib.get_close_matches(query, channel_map.keys(), n=1, cutoff=0.4)
         if matches:
             return channel_map[matches[0]]
         return None
 
+    async def _store_attachment(self, filename: str, data: bytes) -> str:
+        """Saves attachment bytes under a content hash, deduping re-uploads."""
+        # Hash + disk write run off the loop; the refcount INSERT stays on
+        # the event-loop thread so its commit can't interleave with another
+        # transaction on the shared connection.
+        path = await asyncio.to_thread(_hash_and_write, filename, data)
+        with DBHandler(self.db) as db:
+            db.cursor.execute(
+                """INSERT INTO attachment_refs (path, refs) VALUES (?, 1)
+                   ON CONFLICT(path) DO UPDATE SET refs = refs + 1""",
+                (path,),
+            )
+        return path
+
+    async def _release_attachments(self, paths: List[str]):
+        """Drops one reference per path and unlinks files nobody uses."""
+        if not paths:
+            return
+        dead = []
+        with DBHandler(self.db) as db:
+            for path in paths:
+                db.cursor.execute(
+                    "SELECT refs FROM attachment_refs WHERE path = ?", (path,)
+                )
+                row = db.cursor.fetchone()
+                if row is not None and row[0] > 1:
+                    db.cursor.execute(
+                        "UPDATE attachment_refs SET refs = refs - 1 WHERE path = ?",
+                        (path,),
+                    )
+                else:
+                    # Last reference, or a pre-dedup timestamped file.
+                    db.cursor.execute(
+                        "DELETE FROM attachment_refs WHERE path = ?", (path,)
+                    )
+                    dead.append(path)
+        if dead:
+            # Unlink off the event loop so bulk cleanups don't block it.
+            await asyncio.to_thread(_unlink_all, dead)
+
+    def _new_embed(self, description: Optional[str], color: int) -> discord.Embed:
+        """Builds the standard announcement embed shell."""
+        embed = discord.Embed(
+            description=description if description else None,
+            color=color,
+            timestamp=datetime.now(),
+        )
+        embed.set_footer(text=_FOOTER_TEXT)
+        return embed
+
+    def _handle_key_channel(self, config, value):
+        config["channel"] = value
+
+    def _handle_key_mention(self, config, value):
+        config["mentions"].extend(r.strip() for r in value.split(",") if r.strip())
+
+    def _handle_key_everyone(self, config, value):
+        config["everyone"] = value.lower() == "true"
+
+    def _handle_key_preview(self, config, value):
+        config["preview"] = value.lower() == "true"
+
+    def _handle_key_poll(self, config, value):
+        config["poll"] = value.lower() == "true"
+
+    def _handle_key_schedule(self, config, value):
+        config["schedule"] = self._parse_schedule_time(value)
+
+    def _handle_key_color(self, config, value):
+        if value.lower() in COLOR_MAP:
+            config["color"] = COLOR_MAP[value.lower()]
+        elif value.startswith("0x"):
+            try:
+                config["color"] = int(value, 16)
+            except ValueError:
+                pass
+
+    def _handle_key_button(self, config, value):
+        # format: button: Label | URL
+        parts = value.split("|")
+        if len(parts) >= 2:
+            config["buttons"].append((parts[0].strip(), parts[1].strip()))
+
+    _KEY_HANDLERS = {
+        "channel": _handle_key_channel,
+        "mention": _handle_key_mention,
+        "everyone": _handle_key_everyone,
+        "preview": _handle_key_preview,
+        "poll": _handle_key_poll,
+        "schedule": _handle_key_schedule,
+        "color": _handle_key_color,
+        "button": _handle_key_button,
+    }
+
     def _parse_content(self, content: str) -> Tuple[Dict[str, Any], str, str]:
         """
         Parses content for keys and separates description.
@@ -218,76 +563,19 @@ class EmbedBot(discord.Client):
             outside_content (str): Content to outside the embed
             embed_description (str): Content inside the embed
         """
-        content_lines = content.split("\n")
         embed_lines = []
         outside_lines = []
 
-        config = {
-            "color": 0x2B2D31,
-            "everyone": False,
-            "preview": False,
-            "poll": False,
-            "channel": None,
-            "schedule": None,
-            "buttons": [],
-            "mentions": [],
-        }
-
-        for line in content_lines:
-            clean_line = line.strip()
-            lower_line = clean_line.lower()
-
-            # Helper to safely extract value
-            def get_val(prefix):
-                try:
-                    return clean_line.split(":", 1)[1].strip()
-                except IndexError:
-                    return ""
-
-            if lower_line.startswith("channel:"):
-                config["channel"] = get_val("channel:")
-                continue
-
-            if lower_line.startswith("mention:"):
-                val = get_val("mention:")
-                role_names = [r.strip() for r in val.split(",") if r.strip()]
-                config["mentions"].extend(role_names)
-                continue
-
-            if lower_line.startswith("everyone:"):
-                config["everyone"] = lower_line.split(":", 1)[1].strip() == "true"
-                continue
-
-            if lower_line.startswith("preview:"):
-                config["preview"] = lower_line.split(":", 1)[1].strip() == "true"
-                continue
-
-            if lower_line.startswith("poll:"):
-                config["poll"] = lower_line.split(":", 1)[1].strip() == "true"
-                continue
-
-            if lower_line.startswith("schedule:"):
-                config["schedule"] = self._parse_schedule_time(get_val("schedule:"))
-                continue
-
-            if lower_line.startswith("color:"):
-                val = get_val("color:")
-                if val.lower() in COLOR_MAP:
-                    config["color"] = COLOR_MAP[val.lower()]
-                elif val.startswith("0x"):
-                    try:
-                        config["color"] = int(val, 16)
-                    except ValueError:
-                        pass
-                continue
+        config = {**_BASE_CONFIG, "buttons": [], "mentions": []}
 
-            if lower_line.startswith("button:"):
-                # format: button: Label | URL
-                val = get_val("button:")
-                parts = val.split("|")
-                if len(parts) >= 2:
-                    config["buttons"].append((parts[0].strip(), parts[1].strip()))
-                continue
+        for line in content.splitlines():
+            # Cheap gate: prose lines without a colon can never be config keys.
+            if ":" in line:
+                key, _, value = line.partition(":")
+                handler = self._KEY_HANDLERS.get(key.strip().lower())
+                if handler is not None:
+                    handler(self, config, value.strip())
+                    continue
 
             # Legacy mentions
             if "@everyone" in line or "@here" in line:
@@ -312,9 +600,9 @@ class EmbedBot(discord.Client):
             await self._handle_reply_edit(message)
 
     async def _handle_command_list(self, message: discord.Message):
-        with DBHandler(DB_NAME) as db:
+        with DBHandler(self.db) as db:
             db.cursor.execute(
-                "SELECT id, channel_name, run_at FROM scheduled ORDER BY run_at ASC"
+                "SELECT id, channel_name, run_at_ts FROM scheduled ORDER BY run_at_ts ASC"
             )
             rows = db.cursor.fetchall()
 
@@ -322,19 +610,33 @@ class EmbedBot(discord.Client):
             await message.channel.send("📭 No scheduled announcements.")
             return
 
-        text = "**📅 Scheduled Announcements:**\n"
-        for r in rows:
-            text += f"`#{r[0]}` | Channel: `{r[1]}` | Time: `{r[2]}`\n"
-        await message.channel.send(text)
+        lines = ["**📅 Scheduled Announcements:**"]
+        lines.extend(
+            f"`#{r[0]}` | Channel: `{r[1]}` | Time: `{_format_run_at(r[2])}`"
+            for r in rows
+        )
+        # Discord caps messages at 2000 chars; chunk by joined length.
+        chunk = []
+        chunk_len = 0
+        for line in lines:
+            if chunk and chunk_len + len(line) + 1 > 1900:
+                await message.channel.send("\n".join(chunk))
+                chunk = []
+                chunk_len = 0
+            chunk.append(line)
+            chunk_len += len(line) + 1
+        if chunk:
+            await message.channel.send("\n".join(chunk))
 
     async def _handle_command_cancel(self, message: discord.Message, arg: str):
         try:
             row_id = int(arg)
-            with DBHandler(DB_NAME) as db:
+            with DBHandler(self.db) as db:
                 db.cursor.execute("DELETE FROM scheduled WHERE id = ?", (row_id,))
                 deleted = db.cursor.rowcount > 0
 
             if deleted:
+                self._notify_schedule_changed()
                 await message.channel.send(f"✅ Cancelled announcement `{row_id}`.")
             else:
                 await message.channel.send(f"⚠️ Could not find announcement `{row_id}`.")
@@ -369,7 +671,7 @@ class EmbedBot(discord.Client):
             return
 
         if content_lower.startswith("cancel:"):
-            arg = content_lower.split(":", 1)[1].strip()
+            arg = content_lower.partition(":")[2].strip()
             await self._handle_command_cancel(message, arg)
             return
 
@@ -379,7 +681,7 @@ class EmbedBot(discord.Client):
         if content_lower.startswith("edit:"):
             try:
                 first_line, remaining = message.content.split("\n", 1)
-                edit_id = int(first_line.split(":", 1)[1].strip())
+                edit_id = int(first_line.partition(":")[2].strip())
                 msg_content_without_cmd = remaining
             except (ValueError, IndexError):
                 await message.channel.send(
@@ -392,17 +694,12 @@ class EmbedBot(discord.Client):
         )
 
         # Prepare Embed
-        embed = discord.Embed(
-            description=embed_description if embed_description else None,
-            color=config["color"],
-            timestamp=datetime.now(),
-        )
+        embed = self._new_embed(embed_description, config["color"])
         embed.set_author(
             name=message.author.display_name, icon_url=message.author.display_avatar.url
         )
-        embed.set_footer(text="D7M Announcement")
 
-        view = LinkButtonView(config["buttons"]) if config["buttons"] else None
+        view = _build_view(tuple(config["buttons"])) if config["buttons"] else None
 
         # Handle Attachments
         discord_files = []
@@ -412,14 +709,28 @@ class EmbedBot(discord.Client):
         if has_attachments:
             if config["schedule"] or edit_id:
                 os.makedirs("attachments", exist_ok=True)
-                for att in message.attachments:
-                    safe_name = f"{int(datetime.now().timestamp())}_{att.filename}"
-                    path = os.path.join("attachments", safe_name)
-                    await att.save(path)
-                    saved_file_paths.append(path)
+                # Fetch every attachment from the CDN concurrently.
+                payloads = await asyncio.gather(
+                    *(att.read() for att in message.attachments)
+                )
+                saved_file_paths = [
+                    await self._store_attachment(att.filename, data)
+                    for att, data in zip(message.attachments, payloads)
+                ]
             else:
-                for att in message.attachments:
-                    discord_files.append(await att.to_file())
+                # Download all attachments concurrently; one failure should
+                # not lose the rest.
+                results = await asyncio.gather(
+                    *(att.to_file() for att in message.attachments),
+                    return_exceptions=True,
+                )
+                for att, result in zip(message.attachments, results):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            f"Failed to download attachment {att.filename}: {result}"
+                        )
+                    else:
+                        discord_files.append(result)
 
         # Resolve Channel
         target_channel = None
@@ -505,28 +816,26 @@ class EmbedBot(discord.Client):
         discord_files,
         saved_file_paths,
     ):
-        preview_mentions = outside_content
+        parts = [f"👀 **Preview** for {target_channel_info}:"]
+        if outside_content:
+            parts.append(outside_content)
         if config["mentions"]:
-            preview_mentions += "\n(Mentions: " + ", ".join(config["mentions"]) + ")"
-
-        await message.channel.send(
-            f"👀 **Preview** for {target_channel_info}:", embed=embed, view=view
-        )
-        if preview_mentions.strip():
-            await message.channel.send(preview_mentions)
+            parts.append(f"(Mentions: {', '.join(config['mentions'])})")
 
         # Files in preview
         preview_files = []
         if saved_file_paths:
-            for p in saved_file_paths:
-                preview_files.append(discord.File(p))
+            preview_files = [discord.File(p) for p in saved_file_paths]
         elif discord_files:
             preview_files = discord_files  # Reuse objects
 
-        if preview_files:
-            await message.channel.send(
-                "*(Attachments included in preview)*", files=preview_files
-            )
+        # One REST call instead of three.
+        await message.channel.send(
+            "\n".join(parts),
+            embed=embed,
+            view=view,
+            files=preview_files if preview_files else None,
+        )
 
     async def _resolve_mentions(
         self, outside_content, mentions, target_channel, message
@@ -536,16 +845,14 @@ class EmbedBot(discord.Client):
 
         guild = target_channel.guild
         role_mentions = []
-        role_map = {r.name.lower(): r for r in guild.roles}
 
+        seen = set()
         for role_name in mentions:
-            found_role = role_map.get(role_name.lower())
-            if not found_role:
-                matches = difflib.get_close_matches(
-                    role_name.lower(), role_map.keys(), n=1, cutoff=0.5
-                )
-                if matches:
-                    found_role = role_map[matches[0]]
+            query = role_name.lower()
+            if query in seen:
+                continue
+            seen.add(query)
+            found_role = self._resolve_role(guild, role_name)
 
             if found_role:
                 role_mentions.append(found_role.mention)
@@ -571,23 +878,22 @@ class EmbedBot(discord.Client):
         has_new_attachments,
         old_att_paths_strategy="replace",
     ):
-        with DBHandler(DB_NAME) as db:
+        with DBHandler(self.db) as db:
             db.cursor.execute(
-                "SELECT content, run_at, attachment_paths FROM scheduled WHERE id = ?",
+                "SELECT content, run_at_ts, attachment_paths FROM scheduled WHERE id = ?",
                 (edit_id,),
             )
             row = db.cursor.fetchone()
             if not row:
                 return  # Should handle cleaner but calling method checks existence? No it doesn't fully.
 
-            old_raw, old_run_at, old_att_paths = row
+            old_raw, old_run_at_ts, old_att_paths = row
 
             # Run At
-            new_run_at = config["schedule"] if config["schedule"] else old_run_at
-            run_at_str = (
-                new_run_at
-                if isinstance(new_run_at, str)
-                else new_run_at.strftime("%Y-%m-%d %H:%M:%S")
+            new_run_at_ts = (
+                int(config["schedule"].timestamp())
+                if config["schedule"]
+                else old_run_at_ts
             )
 
             # Attachments
@@ -596,42 +902,47 @@ class EmbedBot(discord.Client):
                 final_att_paths_json = json.dumps(saved_file_paths)
                 if old_att_paths:
                     try:
-                        old_paths = json.loads(old_att_paths)
-                        for p in old_paths:
-                            if os.path.exists(p):
-                                os.remove(p)
-                    except Exception:
+                        await self._release_attachments(json.loads(old_att_paths))
+                    except ValueError:
                         pass
 
             db.cursor.execute(
-                """UPDATE scheduled 
-                                 SET content = ?, channel_name = ?, run_at = ?, attachment_paths = ? 
+                """UPDATE scheduled
+                                 SET content = ?, channel_name = ?, run_at_ts = ?, attachment_paths = ?
                                  WHERE id = ?""",
-                (content, config["channel"], run_at_str, final_att_paths_json, edit_id),
+                (
+                    content,
+                    config["channel"],
+                    new_run_at_ts,
+                    final_att_paths_json,
+                    edit_id,
+                ),
             )
+        self._notify_schedule_changed()
 
     async def _schedule_message(
         self, message, config, saved_file_paths, target_channel
     ):
         wait_time = config["schedule"]
-        run_at_str = wait_time.strftime("%Y-%m-%d %H:%M:%S")
+        run_at_ts = int(wait_time.timestamp())
         att_paths_json = json.dumps(saved_file_paths) if saved_file_paths else None
 
-        with DBHandler(DB_NAME) as db:
+        with DBHandler(self.db) as db:
             db.cursor.execute(
-                "INSERT INTO scheduled (content, run_at, channel_name, author_id, attachment_paths) VALUES (?, ?, ?, ?, ?)",
+                "INSERT INTO scheduled (content, run_at_ts, channel_name, author_id, attachment_paths) VALUES (?, ?, ?, ?, ?)",
                 (
                     message.content,
-                    run_at_str,
+                    run_at_ts,
                     config["channel"],
                     message.author.id,
                     att_paths_json,
                 ),
             )
             new_id = db.cursor.lastrowid
+        self._notify_schedule_changed()
 
         await message.channel.send(
-            f"⏳ Scheduled `#{new_id}` for {target_channel.mention} at `{run_at_str}`."
+            f"⏳ Scheduled `#{new_id}` for {target_channel.mention} at `{_format_run_at(run_at_ts)}`."
         )
 
     async def _send_immediate(
@@ -642,36 +953,81 @@ class EmbedBot(discord.Client):
                 content=content, embed=embed, view=view, files=files
             )
             if poll:
-                await sent_msg.add_reaction("✅")
-                await sent_msg.add_reaction("❌")
+                await asyncio.gather(
+                    sent_msg.add_reaction("✅"), sent_msg.add_reaction("❌")
+                )
             await message.channel.send(f"✅ Sent to {target_channel.mention}!")
         except Exception as e:
             await message.channel.send(f"❌ Error sending: {e}")
             logger.error(f"Error sending announcement: {e}")
 
+    def _notify_schedule_changed(self):
+        self._schedule_changed.set()
+
     async def _check_schedule_loop(self):
         await self.wait_until_ready()
         while not self.is_closed():
             try:
-                now_cairo = datetime.now(CAIRO_TZ)
-                now_str = now_cairo.strftime("%Y-%m-%d %H:%M:%S")
+                with DBHandler(self.db) as db:
+                    db.cursor.execute("SELECT MIN(run_at_ts) FROM scheduled")
+                    next_run_at_ts = db.cursor.fetchone()[0]
+
+                if next_run_at_ts is None:
+                    # Nothing scheduled; sleep until an insert wakes us.
+                    await self._schedule_changed.wait()
+                    self._schedule_changed.clear()
+                    continue
+
+                delay = next_run_at_ts - time.time()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(
+                            self._schedule_changed.wait(), timeout=delay
+                        )
+                        # Schedule changed mid-sleep; recompute the wakeup.
+                        self._schedule_changed.clear()
+                        continue
+                    except asyncio.TimeoutError:
+                        pass
 
-                rows = []
-                with DBHandler(DB_NAME) as db:
+                with DBHandler(self.db) as db:
                     db.cursor.execute(
-                        "SELECT id, content, channel_name, attachment_paths FROM scheduled WHERE run_at <= ?",
-                        (now_str,),
+                        "SELECT id, content, channel_name, attachment_paths FROM scheduled WHERE run_at_ts <= ?",
+                        (int(time.time()),),
                     )
                     rows = db.cursor.fetchall()
 
+                done_ids = []
+                retry = False
                 for row in rows:
-                    await self._execute_scheduled_task(row)
+                    if await self._execute_scheduled_task(row):
+                        done_ids.append(row[0])
+                    else:
+                        retry = True
+
+                # One transaction (and one fsync) for the whole batch.
+                if done_ids:
+                    with DBHandler(self.db) as db:
+                        db.cursor.executemany(
+                            "DELETE FROM scheduled WHERE id = ?",
+                            [(i,) for i in done_ids],
+                        )
+                    # One confirmation DM per tick, not one per message.
+                    if self._owner:
+                        ids_text = ", ".join(f"`#{i}`" for i in done_ids)
+                        await self._owner.send(
+                            f"✅ Executed scheduled message(s): {ids_text}"
+                        )
+
+                if retry:
+                    # Failed rows stay due; back off before retrying them.
+                    await asyncio.sleep(10)
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}")
+                await asyncio.sleep(10)
 
-            await asyncio.sleep(10)
-
-    async def _execute_scheduled_task(self, row):
+    async def _execute_scheduled_task(self, row) -> bool:
+        """Sends one due row. Returns True when the row can be deleted."""
         row_id, raw_content, channel_name, att_paths_json = row
 
         target_channel = self._find_channel(channel_name)
@@ -679,36 +1035,26 @@ class EmbedBot(discord.Client):
             logger.warning(
                 f"Scheduled message {row_id}: Channel {channel_name} not found."
             )
-            with DBHandler(DB_NAME) as db:
-                db.cursor.execute("DELETE FROM scheduled WHERE id = ?", (row_id,))
-            return
+            return True
 
         config, outside, embed_desc = self._parse_content(raw_content)
 
-        embed = discord.Embed(
-            description=embed_desc if embed_desc else None,
-            color=config["color"],
-            timestamp=datetime.now(),
-        )
-        user = self.get_user(OWNER_ID)
+        embed = self._new_embed(embed_desc, config["color"])
+        user = self._owner or self.get_user(OWNER_ID)
         if user:
             embed.set_author(name=user.display_name, icon_url=user.display_avatar.url)
-        embed.set_footer(text="D7M Announcement")
 
-        view = LinkButtonView(config["buttons"]) if config["buttons"] else None
+        view = _build_view(tuple(config["buttons"])) if config["buttons"] else None
 
         # Resolve mentions again
         final_content = outside
         if config["mentions"]:
             guild = target_channel.guild
             role_mentions = []
-            role_map = {r.name.lower(): r for r in guild.roles}
             for r_name in config["mentions"]:
-                matches = difflib.get_close_matches(
-                    r_name.lower(), role_map.keys(), n=1, cutoff=0.5
-                )
-                if matches:
-                    role_mentions.append(role_map[matches[0]].mention)
+                role = self._resolve_role(guild, r_name)
+                if role:
+                    role_mentions.append(role.mention)
             if role_mentions:
                 final_content = (
                     (final_content + "\n" + " ".join(role_mentions))
@@ -716,43 +1062,31 @@ class EmbedBot(discord.Client):
                     else " ".join(role_mentions)
                 )
 
-        files = []
+        paths = []
         if att_paths_json:
             try:
                 paths = json.loads(att_paths_json)
-                for path in paths:
-                    if os.path.exists(path):
-                        files.append(discord.File(path))
-            except Exception as e:
+            except ValueError as e:
                 logger.error(f"Failed to load attachments for {row_id}: {e}")
 
+        files = [discord.File(path) for path in paths if os.path.exists(path)]
+
         try:
             sent_msg = await target_channel.send(
                 content=final_content, embed=embed, view=view, files=files
             )
             if config["poll"]:
-                await sent_msg.add_reaction("✅")
-                await sent_msg.add_reaction("❌")
-
-            with DBHandler(DB_NAME) as db:
-                db.cursor.execute("DELETE FROM scheduled WHERE id = ?", (row_id,))
-
-            if user:
-                await user.send(
-                    f"✅ Executed scheduled message {row_id} in {target_channel.mention}."
+                await asyncio.gather(
+                    sent_msg.add_reaction("✅"), sent_msg.add_reaction("❌")
                 )
 
             # Cleanup files
-            if att_paths_json:
-                paths = json.loads(att_paths_json)
-                for path in paths:
-                    try:
-                        os.remove(path)
-                    except Exception:
-                        pass
+            await self._release_attachments(paths)
 
+            return True
         except Exception as e:
             logger.error(f"Failed to execute scheduled message {row_id}: {e}")
+            return False
 
     async def _handle_reply_edit(self, message):
         """Legacy in-server edit support."""
@@ -769,7 +1103,9 @@ class EmbedBot(discord.Client):
                     embed.description = embed_description if embed_description else None
                     embed.color = discord.Color(config["color"])
                     view = (
-                        LinkButtonView(config["buttons"]) if config["buttons"] else None
+                        _build_view(tuple(config["buttons"]))
+                        if config["buttons"]
+                        else None
                     )
                     await original_message.edit(
                         content=outside_content, embed=embed, view=view